@@ -1,18 +1,33 @@
 import argparse
+import bisect
 import json
 import logging
 import os
 import concurrent.futures
+import contextlib
+import functools
 import subprocess
+import sys
 import threading
+import time
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from storage import (
+    DB_DIR,
+    database_exists,
+    is_valid_address,
+    load_db,
+    save_address,
+)
 from tui import ChallengeUpdate, LogMessage, OrchestratorTUI, RefreshTable
 
 # --- Constants ---
-DB_FILE = "challenges.json"
 JOURNAL_FILE = "challenges.json.journal"
 LOG_FILE = "orchestrator.log"
 RUST_SOLVER_PATH = (
@@ -21,6 +36,40 @@ RUST_SOLVER_PATH = (
 FETCH_INTERVAL = 10 * 60  # 15 minutes
 DEFAULT_SOLVE_INTERVAL = 10 * 60  # 10 minutes
 DEFAULT_SAVE_INTERVAL = 2 * 60  # 2 minutes
+JOURNAL_COMPACT_THRESHOLD = 500  # Journal entries before an early save
+SAVER_POLL_INTERVAL = 5  # seconds
+THREADS_PER_SOLVER = 1  # The Rust solver hashes on a single thread
+SOLVER_MEMORY_GB = 1  # Each solver process holds a 1 GB ROM
+try:
+    TOTAL_MEMORY_GB = (
+        os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // 1024**3
+    )
+except (AttributeError, ValueError, OSError):
+    TOTAL_MEMORY_GB = None  # sysconf is unavailable (e.g. Windows)
+# One solver per core, but leave at least 1 GB for everything else
+DEFAULT_MAX_SOLVERS = (os.cpu_count() or 1) // THREADS_PER_SOLVER
+if TOTAL_MEMORY_GB is not None:
+    DEFAULT_MAX_SOLVERS = min(
+        DEFAULT_MAX_SOLVERS, (TOTAL_MEMORY_GB - 1) // SOLVER_MEMORY_GB
+    )
+DEFAULT_MAX_SOLVERS = max(1, DEFAULT_MAX_SOLVERS)
+SOLVER_IDLE_TIMEOUT = 5 * 60  # seconds an idle solver (and its 1 GB ROM) is kept
+SUBMIT_WORKERS = 4  # Concurrent solution POSTs, decoupled from the solver slots
+HTTP_TIMEOUT = (10, 30)  # (connect, read) seconds for every API request
+
+
+# --- HTTP Session ---
+# One pooled session shared by the fetcher and all submitters, so TCP/TLS
+# connections to the API are kept alive and reused instead of re-handshaking.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.1),
+    ),
+)
 
 
 # --- Logging Setup ---
@@ -38,44 +87,89 @@ def setup_logging():
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 
+def _intern_challenge(c):
+    """Interns a challenge's ID and status in place."""
+    for key in ("challengeId", "status"):
+        if isinstance(c.get(key), str):
+            c[key] = sys.intern(c[key])
+
+
 # --- DatabaseManager for Thread-Safe Operations ---
 class DatabaseManager:
     """Manages the in-memory database with thread-safe operations and journaling."""
 
-    def __init__(self):
+    def __init__(self, pretty=False):
         self._db = {}
+        self._pretty = pretty
+        # address -> {challengeId: challenge} over its queue, for O(1) lookups
+        self._challenges_by_id = {}
+        # address -> challengeIds currently 'available'. Derived, never persisted.
+        self._available_ids = {}
+        # Journal entries (and other mutations) not yet folded into DB_DIR
+        self._pending_changes = 0
+        # Addresses changed since the last save; only these files are rewritten
+        self._dirty_addresses = set()
         # A lock is still good practice for data consistency between background workers.
         self._lock = threading.Lock()
         self._load_from_disk()
+        self._intern_strings()
+        self._index_challenge_ids()
         self._replay_journal()
         self._reset_solving_challenges_on_startup()
+        self._index_available_challenges()
 
     def _load_from_disk(self):
-        if os.path.exists(DB_FILE):
-            try:
-                with open(DB_FILE, "r") as f:
-                    self._db = json.load(f)
-                logging.info("Loaded main database from challenges.json.")
-            except json.JSONDecodeError:
-                logging.error(
-                    f"Error reading {DB_FILE}, starting with an empty database."
-                )
-                self._db = {}
+        self._db = load_db(pretty=self._pretty)
+        logging.info(f"Loaded {len(self._db)} addresses from {DB_DIR}/.")
+
+    def _intern_strings(self):
+        """
+        Interns the short strings repeated across every challenge (addresses,
+        challenge IDs, statuses) so equal values share a single object.
+        """
+        self._db = {sys.intern(address): data for address, data in self._db.items()}
+        for data in self._db.values():
+            for c in data.get("challenge_queue", []):
+                _intern_challenge(c)
+
+    def _index_challenge_ids(self):
+        self._challenges_by_id = {
+            address: {c["challengeId"]: c for c in data.get("challenge_queue", [])}
+            for address, data in self._db.items()
+        }
+
+    def _index_available_challenges(self):
+        self._available_ids = {
+            address: {cid for cid, c in by_id.items() if c.get("status") == "available"}
+            for address, by_id in self._challenges_by_id.items()
+        }
+
+    def _track_status(self, address, challenge_id, status):
+        available = self._available_ids.setdefault(address, set())
+        if status == "available":
+            available.add(challenge_id)
+        else:
+            available.discard(challenge_id)
 
     def _apply_add_challenge(self, address, challenge):
         if address in self._db:
             queue = self._db[address].get("challenge_queue", [])
-            if not any(c["challengeId"] == challenge["challengeId"] for c in queue):
-                queue.append(challenge)
-                queue.sort(key=lambda c: c["challengeId"])
+            by_id = self._challenges_by_id.setdefault(address, {})
+            if challenge["challengeId"] not in by_id:
+                _intern_challenge(challenge)
+                by_id[challenge["challengeId"]] = challenge
+                # The queue is kept sorted, so insert in place rather than re-sorting
+                bisect.insort(queue, challenge, key=lambda c: c["challengeId"])
+                self._dirty_addresses.add(address)
+                self._track_status(address, challenge["challengeId"], challenge.get("status"))
 
     def _apply_update_challenge(self, address, challenge_id, update):
-        if address in self._db:
-            queue = self._db[address].get("challenge_queue", [])
-            for c in queue:
-                if c["challengeId"] == challenge_id:
-                    c.update(update)
-                    break
+        c = self._challenges_by_id.get(address, {}).get(challenge_id)
+        if c is not None:
+            c.update(update)
+            self._dirty_addresses.add(address)
+            if "status" in update:
+                self._track_status(address, challenge_id, update["status"])
 
     def _replay_journal(self):
         if not os.path.exists(JOURNAL_FILE):
@@ -86,7 +180,7 @@ class DatabaseManager:
         with open(JOURNAL_FILE, "r") as f:
             for line in f:
                 try:
-                    log_entry = json.loads(line)
+                    log_entry = orjson.loads(line)
                     action = log_entry.get("action")
                     payload = log_entry.get("payload")
                     address = payload.get("address")
@@ -102,6 +196,7 @@ class DatabaseManager:
                     logging.warning(f"Skipping malformed journal entry: {line.strip()}")
         if replayed_count > 0:
             logging.info(f"Replayed {replayed_count} journal entries.")
+        self._pending_changes += replayed_count
 
     def _reset_solving_challenges_on_startup(self):
         """Resets any 'solving' challenges to 'available' at startup."""
@@ -112,34 +207,60 @@ class DatabaseManager:
                 if c.get("status") == "solving":
                     c["status"] = "available"
                     reset_count += 1
+                    self._dirty_addresses.add(address)
+        self._pending_changes += reset_count
         if reset_count > 0:
             logging.warning(
                 f"Reset {reset_count} challenges from 'solving' to 'available' status on startup."
             )
 
     def _log_to_journal(self, action, payload):
+        self._log_many_to_journal([(action, payload)])
+
+    def _log_many_to_journal(self, entries):
+        """Appends several journal entries with a single open/write of the journal file."""
+        # Counted even if the append fails: the in-memory change still has to reach disk
+        self._pending_changes += len(entries)
         try:
+            ts = datetime.now(timezone.utc).isoformat()
+            lines = [
+                json.dumps({"ts": ts, "action": action, "payload": payload}) + "\n"
+                for action, payload in entries
+            ]
             with open(JOURNAL_FILE, "a") as f:
-                log_entry = {
-                    "ts": datetime.now(timezone.utc).isoformat(),
-                    "action": action,
-                    "payload": payload,
-                }
-                f.write(json.dumps(log_entry) + "\n")
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())
         except IOError as e:
             logging.critical(f"CRITICAL: Could not write to journal file: {e}")
 
-    def add_challenge(self, address, challenge):
+    def add_challenge_for_addresses(self, addresses, challenge):
+        """
+        Adds a copy of `challenge` to every address that does not have it yet.
+        The lock is taken once and all journal entries are written in one go.
+        Returns the list of addresses the challenge was added to.
+        """
         with self._lock:
-            queue = self._db.get(address, {}).get("challenge_queue", [])
-            if any(c["challengeId"] == challenge["challengeId"] for c in queue):
-                return False
+            added = []
+            entries = []
+            for address in addresses:
+                if address not in self._db:
+                    continue
+                if challenge["challengeId"] in self._challenges_by_id.get(address, ()):
+                    continue
+                entries.append(
+                    (
+                        "add_challenge",
+                        {"address": address, "challenge": deepcopy(challenge)},
+                    )
+                )
+                added.append(address)
 
-            self._log_to_journal(
-                "add_challenge", {"address": address, "challenge": challenge}
-            )
-            self._apply_add_challenge(address, challenge)
-            return True
+            if entries:
+                self._log_many_to_journal(entries)
+                for _, payload in entries:
+                    self._apply_add_challenge(payload["address"], payload["challenge"])
+            return added
 
     def update_challenge(self, address, challenge_id, update):
         with self._lock:
@@ -155,23 +276,170 @@ class DatabaseManager:
         with self._lock:
             return list(self._db.keys())
 
-    def get_challenge_queue(self, address):
+    def get_available_challenges(self):
+        """
+        Returns copies of every 'available' challenge as (address, challenge) pairs,
+        in address then challengeId order, without scanning the full queues.
+        """
+        with self._lock:
+            return [
+                (address, deepcopy(self._challenges_by_id[address][cid]))
+                for address, ids in self._available_ids.items()
+                for cid in sorted(ids)
+            ]
+
+    def get_all_challenge_queues(self):
+        """Returns a copy of every address's queue, taken under a single lock."""
         with self._lock:
-            return deepcopy(self._db.get(address, {}).get("challenge_queue", []))
+            return {
+                address: deepcopy(data.get("challenge_queue", []))
+                for address, data in self._db.items()
+            }
+
+    def needs_compaction(self):
+        """True once the journal has grown enough to be worth folding in early."""
+        with self._lock:
+            return self._pending_changes >= JOURNAL_COMPACT_THRESHOLD
 
     def save_to_disk(self):
-        logging.info("Saving database to disk...")
         with self._lock:
+            if not self._dirty_addresses and self._pending_changes == 0:
+                logging.info("No changes since last save, skipping.")
+                return
+            logging.info(
+                f"Saving {len(self._dirty_addresses)} changed addresses to disk..."
+            )
             try:
-                with open(DB_FILE, "w") as f:
-                    json.dump(self._db, f, indent=4)
+                for address in self._dirty_addresses:
+                    save_address(address, self._db[address], pretty=self._pretty)
                 if os.path.exists(JOURNAL_FILE):
                     open(JOURNAL_FILE, "w").close()
+                self._dirty_addresses.clear()
+                self._pending_changes = 0
                 logging.info("Database saved successfully.")
             except IOError as e:
                 logging.error(f"Error saving database: {e}")
 
 
+# --- Persistent Rust Solver Processes ---
+class SolverError(Exception):
+    """Raised when a solver process rejects a challenge or dies mid-solve."""
+
+
+class SolverProcess:
+    """
+    A long-running `ashmaize-solver --server` process. Challenges are written to its
+    stdin as JSON lines and each is answered with one JSON line on stdout, so the
+    process start-up and ROM generation are paid once rather than per challenge.
+    """
+
+    def __init__(self):
+        self._process = subprocess.Popen(
+            [RUST_SOLVER_PATH, "--server"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+
+    def is_alive(self):
+        return self._process.poll() is None
+
+    def solve(self, address, c):
+        request = {
+            "address": address,
+            "challenge_id": c["challengeId"],
+            "difficulty": c["difficulty"],
+            "no_pre_mine": str(c["noPreMine"]),
+            "latest_submission": c["latestSubmission"],
+            "no_pre_mine_hour": str(c["noPreMineHour"]),
+        }
+        try:
+            self._process.stdin.write(json.dumps(request) + "\n")
+            self._process.stdin.flush()
+            line = self._process.stdout.readline()
+        except (BrokenPipeError, ValueError):
+            line = ""
+
+        if not line:
+            # EOF: the process was terminated (shutdown) or crashed
+            self.close()
+            raise SolverError(self._process.stderr.read().strip() or "solver exited")
+
+        response = json.loads(line)
+        if "error" in response:
+            raise SolverError(response["error"])
+        return response["nonce"]
+
+    def close(self):
+        if self.is_alive():
+            self._process.terminate()
+        self._process.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SolverPool:
+    """Lends persistent solver processes to solver tasks, starting them on demand."""
+
+    def __init__(self):
+        self._idle = []
+        self._all = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @contextlib.contextmanager
+    def acquire(self):
+        with self._lock:
+            if self._closed:
+                raise SolverError("solver pool is closed")
+            if self._idle:
+                solver, _ = self._idle.pop()
+            else:
+                solver = SolverProcess()
+                self._all.append(solver)
+        try:
+            yield solver
+        finally:
+            with self._lock:
+                if solver.is_alive() and not self._closed:
+                    self._idle.append((solver, time.monotonic()))
+                elif solver in self._all:
+                    self._all.remove(solver)
+
+    def reap_idle(self, max_idle):
+        """Terminates solvers left idle for more than max_idle seconds, freeing their ROM."""
+        cutoff = time.monotonic() - max_idle
+        with self._lock:
+            stale = [solver for solver, since in self._idle if since < cutoff]
+            self._idle = [(solver, since) for solver, since in self._idle if since >= cutoff]
+            for solver in stale:
+                self._all.remove(solver)
+        for solver in stale:
+            solver.close()
+        return len(stale)
+
+    def close(self):
+        """Terminates every solver; tasks blocked on one get a SolverError."""
+        with self._lock:
+            self._closed = True
+            solvers = list(self._all)
+            self._idle.clear()
+        for solver in solvers:
+            solver.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 # --- Worker Functions ---
 # Note: These are now designed to be run by a Textual @work decorator.
 # They accept a `tui_app` object to post messages back to the UI thread.
@@ -179,6 +447,10 @@ class DatabaseManager:
 
 def fetcher_worker(db_manager, stop_event, tui_app):
     tui_app.post_message(LogMessage("Fetcher thread started."))
+    # The endpoint serves one challenge for all addresses, so a single GET per poll
+    # already covers every address. Remember what was fanned out last time so an
+    # unchanged challenge costs nothing beyond that request.
+    last_challenge_id = None
     while not stop_event.is_set():
         tui_app.post_message(LogMessage("Fetching new challenges..."))
         addresses = db_manager.get_addresses()
@@ -188,7 +460,10 @@ def fetcher_worker(db_manager, stop_event, tui_app):
             )
         else:
             try:
-                response = requests.get("https://scavenger.prod.gd.midnighttge.io/challenge")
+                response = SESSION.get(
+                    "https://scavenger.prod.gd.midnighttge.io/challenge",
+                    timeout=HTTP_TIMEOUT,
+                )
                 response.raise_for_status()
                 challenge_data = response.json()["challenge"]
 
@@ -204,17 +479,30 @@ def fetcher_worker(db_manager, stop_event, tui_app):
                     "availableAt": challenge_data["issued_at"],
                 }
 
-                added = False
-                for address in addresses:
-                    if db_manager.add_challenge(address, deepcopy(new_challenge)):
-                        tui_app.post_message(
-                            LogMessage(
-                                f"New challenge {new_challenge['challengeId']} added for {address[:10]}..."
-                            )
+                if new_challenge["challengeId"] == last_challenge_id:
+                    tui_app.post_message(
+                        LogMessage(
+                            f"Challenge {last_challenge_id} unchanged, nothing new to add."
                         )
-                        added = True
+                    )
+                    stop_event.wait(FETCH_INTERVAL)
+                    continue
 
-                if added:
+                # One challenge is shared by every address: fan it out in a single
+                # batched DB update instead of one locked journal write per address.
+                added_addresses = db_manager.add_challenge_for_addresses(
+                    addresses, new_challenge
+                )
+                for address in added_addresses:
+                    tui_app.post_message(
+                        LogMessage(
+                            f"New challenge {new_challenge['challengeId']} added for {address[:10]}..."
+                        )
+                    )
+
+                last_challenge_id = new_challenge["challengeId"]
+
+                if added_addresses:
                     # Signal to the UI that a full refresh is needed to show the new column
                     tui_app.post_message(RefreshTable())
 
@@ -229,47 +517,46 @@ def fetcher_worker(db_manager, stop_event, tui_app):
     logging.info("Fetcher thread stopped.")
 
 
-def _solve_one_challenge(db_manager, tui_app, stop_event, address, challenge):
-    """Solves a single challenge."""
+def _solve_one_challenge(
+    db_manager, tui_app, stop_event, solver_pool, submit_executor, address, challenge
+):
+    """Solves a single challenge and hands the solution off for submission."""
     c = challenge
     msg = f"Attempting to solve challenge {c['challengeId']} for {address[:10]}..."
     tui_app.post_message(LogMessage(msg))
 
-    submit_response = None
-    crypto_receipt = None
-
     try:
-        command = [
-            RUST_SOLVER_PATH,
-            "--address", address,
-            "--challenge-id", c["challengeId"],
-            "--difficulty", c["difficulty"],
-            "--no-pre-mine", str(c["noPreMine"]),
-            "--latest-submission", c["latestSubmission"],
-            "--no-pre-mine-hour", str(c["noPreMineHour"]),
-        ]
-
-        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-
-        while process.poll() is None:
-            if stop_event.is_set():
-                process.terminate()
-                tui_app.post_message(LogMessage(f"Solver for {c['challengeId']} terminated by shutdown."))
-                db_manager.update_challenge(address, c["challengeId"], {"status": "available"})
-                return
-            stop_event.wait(0.2)
-
-        stdout, stderr = process.communicate()
+        with solver_pool.acquire() as solver:
+            nonce = solver.solve(address, c)
 
-        if process.returncode != 0:
-            raise subprocess.CalledProcessError(process.returncode, command, output=stdout, stderr=stderr)
-
-        nonce = stdout.strip()
         solved_time = datetime.now(timezone.utc)
         tui_app.post_message(LogMessage(f"Found nonce: {nonce} for {c['challengeId']}"))
 
+        # Submit in the background so this solver slot is freed for the next challenge
+        # while the POST is in flight. The challenge stays 'solving' until it completes.
+        submit_executor.submit(
+            _submit_solution, db_manager, tui_app, address, c, nonce, solved_time
+        )
+
+    except SolverError as e:
+        if stop_event.is_set():
+            tui_app.post_message(LogMessage(f"Solver for {c['challengeId']} terminated by shutdown."))
+        else:
+            tui_app.post_message(LogMessage(f"Rust solver error for {c['challengeId']}: {e}"))
+        db_manager.update_challenge(address, c["challengeId"], {"status": "available"})
+    except Exception as e:
+        tui_app.post_message(LogMessage(f"Unexpected error solving {c['challengeId']}: {e}"))
+        db_manager.update_challenge(address, c["challengeId"], {"status": "available"})
+
+
+def _submit_solution(db_manager, tui_app, address, c, nonce, solved_time):
+    """Submits a found nonce to the API and records the outcome."""
+    submit_response = None
+    crypto_receipt = None
+
+    try:
         submit_url = f"https://scavenger.prod.gd.midnighttge.io/solution/{address}/{c['challengeId']}/{nonce}"
-        submit_response = requests.post(submit_url, json={})
+        submit_response = SESSION.post(submit_url, json={}, timeout=HTTP_TIMEOUT)
 
         # Handle "already exists" before raising errors
         if submit_response.status_code == 400 and "Solution already exists" in submit_response.text:
@@ -293,16 +580,13 @@ def _solve_one_challenge(db_manager, tui_app, stop_event, address, challenge):
             tui_app.post_message(LogMessage(msg))
             db_manager.update_challenge(address, c["challengeId"], {"status": "submission_error", "salt": nonce})
 
-    except subprocess.CalledProcessError as e:
-        tui_app.post_message(LogMessage(f"Rust solver error for {c['challengeId']}: {e.stderr.strip()}"))
-        db_manager.update_challenge(address, c["challengeId"], {"status": "available"})
     except requests.exceptions.RequestException as e:
         tui_app.post_message(LogMessage(f"Error submitting solution for {c['challengeId']}: {e}"))
         if submit_response is not None:
             tui_app.post_message(LogMessage(submit_response.text))
         db_manager.update_challenge(address, c["challengeId"], {"status": "available"})
     except Exception as e:
-        tui_app.post_message(LogMessage(f"Unexpected error solving {c['challengeId']}: {e}"))
+        tui_app.post_message(LogMessage(f"Unexpected error submitting {c['challengeId']}: {e}"))
         if submit_response is not None:
             tui_app.post_message(LogMessage(submit_response.text))
         db_manager.update_challenge(address, c["challengeId"], {"status": "available"})
@@ -332,6 +616,31 @@ def __confirm_submission(db_manager, tui_app, address, c, crypto_receipt, solved
         tui_app.post_message(ChallengeUpdate(address, c["challengeId"], updated_status))
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_timestamp(timestamp):
+    """
+    Parses an API timestamp such as '2025-10-31T15:59:59.000Z'. Every address shares
+    the same few challenges, so each distinct string only needs parsing once.
+    """
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+
+def _format_timestamp(dt):
+    """Formats a UTC datetime the way the API does, e.g. '2025-10-31T15:59:59.000Z'."""
+    return dt.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _is_expired(latest_submission, now, now_iso):
+    """
+    Whether `latest_submission` is in the past. Timestamps in the API's fixed-width
+    form sort lexicographically, so they are compared as strings against `now_iso`;
+    anything else falls back to a datetime comparison.
+    """
+    if len(latest_submission) == len(now_iso) and latest_submission.endswith("Z"):
+        return now_iso > latest_submission
+    return now > _parse_timestamp(latest_submission)
+
+
 def solver_worker(db_manager, stop_event, solve_interval, tui_app, max_solvers):
     tui_app.post_message(
         LogMessage(
@@ -339,8 +648,14 @@ def solver_worker(db_manager, stop_event, solve_interval, tui_app, max_solvers):
         )
     )
 
-    # The executor should live for the duration of the worker
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_solvers) as executor:
+    # The executors and solver processes should live for the duration of the worker.
+    # The solver pool is listed first so it is closed last, and the submit executor
+    # outlives the solver executor so no task is left handing off a nonce.
+    with SolverPool() as solver_pool, concurrent.futures.ThreadPoolExecutor(
+        max_workers=SUBMIT_WORKERS
+    ) as submit_executor, concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_solvers
+    ) as executor:
         # Store futures for active tasks
         active_futures = set()
         last_logged_check_time = datetime.min.replace(
@@ -357,6 +672,8 @@ def solver_worker(db_manager, stop_event, solve_interval, tui_app, max_solvers):
             done_futures = {f for f in active_futures if f.done()}
             for f in done_futures:
                 active_futures.remove(f)
+                if not f.cancelled() and f.exception() is not None:
+                    logging.error(f"Solver task crashed: {f.exception()!r}")
 
             available_slots = max_solvers - len(active_futures)
             if available_slots <= 0:
@@ -369,63 +686,50 @@ def solver_worker(db_manager, stop_event, solve_interval, tui_app, max_solvers):
 
             challenges_dispatched_this_round = 0
             if available_slots > 0:
-                addresses = db_manager.get_addresses()
                 now = datetime.now(timezone.utc)
-                should_break_outer_loop = False
-
-                for address in addresses:
-                    challenges = db_manager.get_challenge_queue(address)
-                    for c in challenges:
-                        if c["status"] == "available":
-                            latest_submission = datetime.fromisoformat(
-                                c["latestSubmission"].replace("Z", "+00:00")
+                now_iso = _format_timestamp(now)
+
+                # Only 'available' challenges are visited; solved/expired ones are
+                # skipped by the DB's status index rather than scanned here.
+                for address, c in db_manager.get_available_challenges():
+                    if _is_expired(c["latestSubmission"], now, now_iso):
+                        # Expire challenge
+                        updated_status = db_manager.update_challenge(
+                            address, c["challengeId"], {"status": "expired"}
+                        )
+                        if updated_status:
+                            msg = f"Challenge {c['challengeId']} for {address[:10]}... has expired."
+                            tui_app.post_message(LogMessage(msg))
+                            tui_app.post_message(
+                                ChallengeUpdate(address, c["challengeId"], updated_status)
                             )
-                            if now > latest_submission:
-                                # Expire challenge
-                                updated_status = db_manager.update_challenge(
-                                    address, c["challengeId"], {"status": "expired"}
-                                )
-                                if updated_status:
-                                    msg = f"Challenge {c['challengeId']} for {address[:10]}... has expired."
-                                    tui_app.post_message(LogMessage(msg))
-                                    tui_app.post_message(
-                                        ChallengeUpdate(
-                                            address, c["challengeId"], updated_status
-                                        )
-                                    )
-                            else:
-                                if available_slots > 0:
-                                    # Claim the challenge by updating its status
-                                    # This update is protected by DatabaseManager's lock
-                                    updated_status = db_manager.update_challenge(
-                                        address, c["challengeId"], {"status": "solving"}
-                                    )
-                                    if updated_status:
-                                        tui_app.post_message(
-                                            ChallengeUpdate(
-                                                address,
-                                                c["challengeId"],
-                                                updated_status,
-                                            )
-                                        )
-                                        # Submit claimed challenge to the thread pool
-                                        future = executor.submit(
-                                            _solve_one_challenge,
-                                            db_manager,
-                                            tui_app,
-                                            stop_event,
-                                            address,
-                                            deepcopy(c),  # Pass a deepcopy
-                                        )
-                                        active_futures.add(future)
-                                        challenges_dispatched_this_round += 1
-                                        available_slots -= 1
-                                else:
-                                    # No more slots available in the current pass
-                                    should_break_outer_loop = True
-                                    break  # Exit inner challenge loop
-                    if should_break_outer_loop:
-                        break  # Exit outer address loop
+                    elif available_slots > 0:
+                        # Claim the challenge by updating its status
+                        # This update is protected by DatabaseManager's lock
+                        updated_status = db_manager.update_challenge(
+                            address, c["challengeId"], {"status": "solving"}
+                        )
+                        if updated_status:
+                            tui_app.post_message(
+                                ChallengeUpdate(address, c["challengeId"], updated_status)
+                            )
+                            # Submit claimed challenge to the thread pool
+                            future = executor.submit(
+                                _solve_one_challenge,
+                                db_manager,
+                                tui_app,
+                                stop_event,
+                                solver_pool,
+                                submit_executor,
+                                address,
+                                c,  # Already a copy
+                            )
+                            active_futures.add(future)
+                            challenges_dispatched_this_round += 1
+                            available_slots -= 1
+                    else:
+                        # No more slots available in the current pass
+                        break
 
                 if challenges_dispatched_this_round > 0:
                     tui_app.post_message(
@@ -437,6 +741,13 @@ def solver_worker(db_manager, stop_event, solve_interval, tui_app, max_solvers):
                 elif len(active_futures) == 0 and challenges_dispatched_this_round == 0:
                     tui_app.post_message(LogMessage("No available challenges found."))
 
+            # Only reap on rounds that handed out no work, so a solver is never closed
+            # just before a freshly dispatched task would have picked it up.
+            if challenges_dispatched_this_round == 0:
+                reaped = solver_pool.reap_idle(SOLVER_IDLE_TIMEOUT)
+                if reaped:
+                    logging.info(f"Stopped {reaped} idle solver processes.")
+
             # If all slots are full, wait for one future to complete, or a short timeout
             if len(active_futures) >= max_solvers and active_futures:
                 # Wait for at least one task to complete or a short period if none are done quickly
@@ -450,6 +761,11 @@ def solver_worker(db_manager, stop_event, solve_interval, tui_app, max_solvers):
                 # wait the full solve_interval before checking for *new* challenges again.
                 stop_event.wait(solve_interval)
 
+        # Terminate the solver processes so running tasks return, and drop anything
+        # not yet started so shutdown never waits on fresh work.
+        solver_pool.close()
+        executor.shutdown(wait=True, cancel_futures=True)
+
     logging.info("Solver thread stopped.")
 
 
@@ -459,67 +775,90 @@ def saver_worker(db_manager, stop_event, interval, tui_app):
             f"Saver thread started. Saving to disk every {interval / 60:.1f} minutes."
         )
     )
+    last_save = time.monotonic()
     while not stop_event.is_set():
-        stop_event.wait(interval)
+        stop_event.wait(min(interval, SAVER_POLL_INTERVAL))
         if stop_event.is_set():
             break
-        tui_app.post_message(LogMessage("Performing periodic save..."))
+        if db_manager.needs_compaction():
+            tui_app.post_message(LogMessage("Journal is large, compacting early..."))
+        elif time.monotonic() - last_save < interval:
+            continue
+        else:
+            tui_app.post_message(LogMessage("Performing periodic save..."))
         db_manager.save_to_disk()
+        last_save = time.monotonic()
     logging.info("Saver thread stopped.")
 
 
 # --- Main Application Logic ---
-def init_db(json_files):
-    """Initializes or updates the main database file from JSON inputs."""
-    logging.info("Initializing or updating database file...")
-    db = {}
-    if os.path.exists(DB_FILE):
-        try:
-            with open(DB_FILE, "r") as f:
-                db = json.load(f)
-        except json.JSONDecodeError:
-            logging.warning(f"Could not read existing {DB_FILE}, starting fresh.")
-
-    for file_path in json_files:
-        try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-                address = data.get("registration_receipt", {}).get("walletAddress")
-                if not address:
-                    logging.warning(f"Could not find address in {file_path}, skipping.")
-                    continue
+def _read_input_file(file_path):
+    """Parses one exported JSON file. Returns (file_path, data), with data None on error."""
+    try:
+        return file_path, orjson.loads(Path(file_path).read_bytes())
+    except FileNotFoundError:
+        logging.error(f"File not found: {file_path}")
+    except json.JSONDecodeError:
+        logging.error(f"Error decoding JSON from {file_path}")
+    return file_path, None
 
-                if address not in db:
-                    challenge_queue = data.get("challenge_queue", [])
-                    challenge_queue.sort(key=lambda c: c["challengeId"])
-                    db[address] = {
-                        "registration_receipt": data.get("registration_receipt"),
-                        "challenge_queue": challenge_queue,
-                    }
-                    logging.info(f"Initialized new address: {address}")
-                else:
-                    logging.info(f"Updating existing address: {address}")
-                    existing_ids = {
-                        c["challengeId"] for c in db[address].get("challenge_queue", [])
-                    }
-                    new_challenges = [
-                        c
-                        for c in data.get("challenge_queue", [])
-                        if c["challengeId"] not in existing_ids
-                    ]
-                    if new_challenges:
-                        db[address]["challenge_queue"].extend(new_challenges)
-                        db[address]["challenge_queue"].sort(
-                            key=lambda c: c["challengeId"]
-                        )
-                        logging.info(f"  Added {len(new_challenges)} new challenges.")
-        except FileNotFoundError:
-            logging.error(f"File not found: {file_path}")
-        except json.JSONDecodeError:
-            logging.error(f"Error decoding JSON from {file_path}")
 
-    with open(DB_FILE, "w") as f:
-        json.dump(db, f, indent=4)
+def init_db(json_files, pretty=False):
+    """Initializes or updates the database from JSON inputs."""
+    logging.info("Initializing or updating database file...")
+    db = load_db(pretty=pretty)
+
+    # Parsing is independent per file, so overlap the reads; merging stays serial.
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        parsed_files = list(executor.map(_read_input_file, json_files))
+
+    # address -> challengeIds already queued, built once per address and kept current
+    known_ids = {}
+    # Addresses whose queues gained challenges; each is sorted once after the merge
+    touched_addresses = set()
+    for file_path, data in parsed_files:
+        if data is None:
+            continue
+        address = data.get("registration_receipt", {}).get("walletAddress")
+        if not address:
+            logging.warning(f"Could not find address in {file_path}, skipping.")
+            continue
+        if not is_valid_address(address):
+            logging.warning(f"Invalid address {address!r} in {file_path}, skipping.")
+            continue
+
+        if address not in db:
+            challenge_queue = data.get("challenge_queue", [])
+            touched_addresses.add(address)
+            db[address] = {
+                "registration_receipt": data.get("registration_receipt"),
+                "challenge_queue": challenge_queue,
+            }
+            known_ids[address] = {c["challengeId"] for c in challenge_queue}
+            logging.info(f"Initialized new address: {address}")
+        else:
+            logging.info(f"Updating existing address: {address}")
+            existing_queue = db[address].setdefault("challenge_queue", [])
+            existing_ids = known_ids.get(address)
+            if existing_ids is None:
+                existing_ids = {c["challengeId"] for c in existing_queue}
+                known_ids[address] = existing_ids
+
+            new_challenges_count = 0
+            for challenge in data.get("challenge_queue", []):
+                cid = challenge["challengeId"]
+                if cid not in existing_ids:
+                    existing_ids.add(cid)
+                    existing_queue.append(challenge)
+                    new_challenges_count += 1
+            if new_challenges_count:
+                touched_addresses.add(address)
+                logging.info(f"  Added {new_challenges_count} new challenges.")
+
+    # Only the addresses present in the inputs changed, so only their files are written
+    for address in touched_addresses:
+        db[address]["challenge_queue"].sort(key=lambda c: c["challengeId"])
+        save_address(address, db[address], pretty=pretty)
 
     if os.path.exists(JOURNAL_FILE):
         os.remove(JOURNAL_FILE)
@@ -530,7 +869,7 @@ def init_db(json_files):
 def run_orchestrator(args):
     """Starts and manages the TUI and all worker threads."""
     logging.info("Starting orchestrator TUI...")
-    db_manager = DatabaseManager()
+    db_manager = DatabaseManager(pretty=args.pretty)
 
     worker_functions = {
         "fetcher": fetcher_worker,
@@ -557,6 +896,11 @@ def main():
     parser = argparse.ArgumentParser(
         description="Challenge orchestrator for Midnight scavenger hunt."
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help=f"Write the {DB_DIR}/ files as indented, human-readable JSON (slower and larger).",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     init_parser = subparsers.add_parser(
@@ -568,8 +912,8 @@ def main():
     run_parser.add_argument(
         "--max-solvers",
         type=int,
-        default=14,  # A sensible default
-        help="Maximum number of concurrent solver processes to run (default: 4).",
+        default=DEFAULT_MAX_SOLVERS,  # One solver per core, capped by memory
+        help=f"Maximum number of concurrent solver processes to run. Each one uses about {SOLVER_MEMORY_GB} GB of RAM (default: {DEFAULT_MAX_SOLVERS}).",
     )
     run_parser.add_argument(
         "--solve-interval",
@@ -589,9 +933,9 @@ def main():
     setup_logging()
 
     if args.command == "init":
-        init_db(args.files)
+        init_db(args.files, pretty=args.pretty)
     elif args.command == "run":
-        if not os.path.exists(DB_FILE):
+        if not database_exists():
             print("Database file not found. Please run the 'init' command first.")
             logging.critical("Database file not found. Aborting run.")
             os._exit(1)  # Exit immediately without traceback
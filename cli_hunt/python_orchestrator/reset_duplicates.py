@@ -1,23 +1,17 @@
-import json
-import os
 from collections import defaultdict
 
-DB_FILE = "challenges.json"
+from storage import DB_DIR, database_exists, load_db, save_address
 
 
-def reset_duplicated_challenges(db_file):
-    if not os.path.exists(db_file):
-        print(f"Error: Database file not found at {db_file}")
+def reset_duplicated_challenges():
+    if not database_exists():
+        print(f"Error: Database not found at {DB_DIR}/")
         return
 
     try:
-        with open(db_file, "r") as f:
-            db = json.load(f)
-    except json.JSONDecodeError:
-        print(f"Error: Could not decode JSON from {db_file}")
-        return
+        db = load_db()
     except Exception as e:
-        print(f"An unexpected error occurred while reading {db_file}: {e}")
+        print(f"An unexpected error occurred while reading {DB_DIR}/: {e}")
         return
 
     receipt_to_challenge_map = defaultdict(list)
@@ -55,6 +49,7 @@ def reset_duplicated_challenges(db_file):
 
     # Apply resets
     reset_count = 0
+    changed_addresses = set()
     for address, challenge_id in challenges_to_reset:
         for challenge in db[address]["challenge_queue"]:
             if challenge["challengeId"] == challenge_id:
@@ -65,19 +60,20 @@ def reset_duplicated_challenges(db_file):
                 challenge.pop("salt", None)
                 challenge.pop("cryptoReceipt", None)
                 reset_count += 1
+                changed_addresses.add(address)
                 print(f"Reset challenge {challenge_id} for address {address[:10]}...")
                 break
 
-    # Save the modified database
+    # Save the modified addresses
     try:
-        with open(db_file, "w") as f:
-            json.dump(db, f, indent=4)
+        for address in changed_addresses:
+            save_address(address, db[address])
         print(
-            f"\nSuccessfully reset {reset_count} duplicated challenges and saved to {db_file}."
+            f"\nSuccessfully reset {reset_count} duplicated challenges and saved to {DB_DIR}/."
         )
     except Exception as e:
-        print(f"Error: Could not save modified database to {db_file}: {e}")
+        print(f"Error: Could not save modified database to {DB_DIR}/: {e}")
 
 
 if __name__ == "__main__":
-    reset_duplicated_challenges(DB_FILE)
+    reset_duplicated_challenges()
@@ -0,0 +1,134 @@
+import concurrent.futures
+import glob
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+
+import orjson
+
+# --- Constants ---
+DB_DIR = "db"  # One <address>.json file per address
+DB_FILE = "challenges.json"  # Legacy single-file database, migrated into DB_DIR
+
+
+# --- Database File Serialization ---
+def read_db_file(path):
+    """
+    Parses one address file written by `write_db_file`, or the legacy DB_FILE while it
+    is being migrated. The file is read as raw bytes and handed straight to orjson,
+    skipping Python's text decoding layer. Each address file only holds one record,
+    so there is no need to stream it.
+    """
+    data = Path(path).read_bytes()
+    if not data:
+        return {}
+    return orjson.loads(data)
+
+
+def write_db_file(db, path, pretty=False):
+    """
+    Serializes a database record to `path`. Uses compact orjson output by default;
+    `pretty` falls back to indented stdlib json for a human-readable file.
+    The data is written and fsynced to a temporary file which then atomically
+    replaces `path`, so a crash mid-write never leaves a truncated database.
+    """
+    tmp_path = path + ".tmp"
+    if pretty:
+        with open(tmp_path, "w") as f:
+            json.dump(db, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+    else:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(db, option=orjson.OPT_SORT_KEYS))
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+# --- Per-Address Database ---
+def is_valid_address(address):
+    """True if `address` can safely name a file directly inside DB_DIR."""
+    return (
+        isinstance(address, str)
+        and address not in ("", ".", "..")
+        and "\0" not in address
+        and os.path.basename(address) == address
+    )
+
+
+def _shard_path(address, db_dir=DB_DIR):
+    if not is_valid_address(address):
+        raise ValueError(f"Invalid address for a database file name: {address!r}")
+    return os.path.join(db_dir, f"{address}.json")
+
+
+def _read_shard(path):
+    """Parses one address file. Returns (address, record), with record None on error."""
+    address = os.path.splitext(os.path.basename(path))[0]
+    try:
+        record = read_db_file(path)
+    except json.JSONDecodeError:
+        logging.error(f"Error reading {path}, skipping address {address}.")
+        return address, None
+    if not isinstance(record, dict):
+        logging.error(
+            f"{path} does not hold an address record, skipping address {address}."
+        )
+        return address, None
+    return address, record
+
+
+def _migrate_legacy_db(pretty=False):
+    """Splits a legacy single-file DB_FILE into per-address files under DB_DIR."""
+    try:
+        db = read_db_file(DB_FILE)
+    except json.JSONDecodeError:
+        logging.error(f"Error reading {DB_FILE}, nothing to migrate.")
+        return
+
+    # Build the directory aside and rename it into place, so a crash mid-migration
+    # leaves the legacy file as the only database.
+    tmp_dir = DB_DIR + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    migrated = 0
+    for address, record in db.items():
+        if not is_valid_address(address):
+            logging.warning(f"Skipping invalid address {address!r} in {DB_FILE}.")
+            continue
+        write_db_file(record, _shard_path(address, tmp_dir), pretty=pretty)
+        migrated += 1
+    os.replace(tmp_dir, DB_DIR)
+    logging.info(f"Migrated {migrated} addresses from {DB_FILE} to {DB_DIR}/.")
+
+
+def database_exists():
+    """True if there is a sharded database or a legacy one waiting to be migrated."""
+    return os.path.isdir(DB_DIR) or os.path.exists(DB_FILE)
+
+
+def load_db(pretty=False):
+    """
+    Loads every address record from DB_DIR, migrating a legacy DB_FILE on first use.
+    The per-address files are independent, so they are read in parallel.
+    """
+    if not os.path.isdir(DB_DIR):
+        if not os.path.exists(DB_FILE):
+            return {}
+        _migrate_legacy_db(pretty=pretty)
+        if not os.path.isdir(DB_DIR):
+            return {}
+
+    paths = sorted(glob.glob(os.path.join(DB_DIR, "*.json")))
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        shards = list(executor.map(_read_shard, paths))
+    return {address: record for address, record in shards if record is not None}
+
+
+def save_address(address, record, pretty=False):
+    """Writes a single address record, leaving every other address file untouched."""
+    os.makedirs(DB_DIR, exist_ok=True)
+    write_db_file(record, _shard_path(address), pretty=pretty)
@@ -99,15 +99,16 @@ class OrchestratorTUI(App):
         """
         self.table.clear(columns=True)
 
-        # --- Get current data from DB ---
-        self._addresses = self.db_manager.get_addresses()
+        # --- Get current data from DB (one copy, reused for columns and cells) ---
+        queues = self.db_manager.get_all_challenge_queues()
+        self._addresses = list(queues)
         if not self._addresses:
             self.log_widget.write_line("No addresses found. Table is empty.")
             return
 
         all_challenge_ids = set()
-        for addr in self._addresses:
-            for c in self.db_manager.get_challenge_queue(addr):
+        for queue in queues.values():
+            for c in queue:
                 all_challenge_ids.add(c["challengeId"])
 
         # Sort challenges and keep only the most recent 15
@@ -133,9 +134,7 @@ class OrchestratorTUI(App):
         for addr in self._addresses:
             # Only consider challenges that are actually displayed in the table
             displayed_challenges = [
-                c
-                for c in self.db_manager.get_challenge_queue(addr)
-                if c["challengeId"] in self._challenge_ids
+                c for c in queues[addr] if c["challengeId"] in self._challenge_ids
             ]
             for c in displayed_challenges:
                 self.post_message(ChallengeUpdate(addr, c["challengeId"], c["status"]))
@@ -1,6 +1,8 @@
 use ashmaize::{Rom, RomGenerationType, hash};
 use clap::Parser;
 use hex;
+use serde::{Deserialize, Serialize};
+use std::io::{self, BufRead, Write};
 
 pub const MB: usize = 1024 * 1024;
 pub const GB: usize = 1024 * MB;
@@ -10,18 +12,41 @@ mod tests;
 #[derive(Parser, Debug)]
 #[command(author, version, about, long_about = None)]
 struct Args {
+    /// Keep running and solve newline-delimited JSON challenges read from stdin,
+    /// answering each with one JSON line on stdout.
     #[arg(long)]
-    address: String,
-    #[arg(long)]
-    challenge_id: String,
-    #[arg(long)]
-    difficulty: String, // This is a hexadecimal string representing the bitmask for the required zero prefix
-    #[arg(long)]
-    no_pre_mine: String,
-    #[arg(long)]
-    latest_submission: String,
-    #[arg(long)]
-    no_pre_mine_hour: String,
+    server: bool,
+    #[arg(long, required_unless_present = "server")]
+    address: Option<String>,
+    #[arg(long, required_unless_present = "server")]
+    challenge_id: Option<String>,
+    #[arg(long, required_unless_present = "server")]
+    difficulty: Option<String>, // This is a hexadecimal string representing the bitmask for the required zero prefix
+    #[arg(long, required_unless_present = "server")]
+    no_pre_mine: Option<String>,
+    #[arg(long, required_unless_present = "server")]
+    latest_submission: Option<String>,
+    #[arg(long, required_unless_present = "server")]
+    no_pre_mine_hour: Option<String>,
+}
+
+/// A challenge to solve, as passed on the command line or as one line of JSON in server mode.
+#[derive(Deserialize, Debug)]
+pub struct Challenge {
+    pub address: String,
+    pub challenge_id: String,
+    pub difficulty: String,
+    pub no_pre_mine: String,
+    pub latest_submission: String,
+    pub no_pre_mine_hour: String,
+}
+
+/// Server mode reply: `{"nonce": "..."}` on success, `{"error": "..."}` otherwise.
+#[derive(Serialize, Debug)]
+#[serde(rename_all = "lowercase")]
+pub enum Response {
+    Nonce(String),
+    Error(String),
 }
 
 pub fn hash_structure_good(hash: &[u8], difficulty_mask: u32) -> bool {
@@ -44,36 +69,97 @@ pub fn init_rom(no_pre_mine_hex: &str) -> Rom {
     )
 }
 
-fn main() {
-    let args = Args::parse();
-
-    // Initialize AshMaize ROM
-    let rom = init_rom(&args.no_pre_mine);
-
+pub fn solve(challenge: &Challenge, rom: &Rom) -> Result<u64, std::num::ParseIntError> {
     let mut nonce: u64 = 0; // Start with a random nonce or 0
 
     // Parse difficulty from hex string to u32 mask
-    let difficulty_mask = u32::from_str_radix(&args.difficulty, 16).unwrap();
+    let difficulty_mask = u32::from_str_radix(&challenge.difficulty, 16)?;
 
     loop {
         let preimage = format!(
             "{0:016x}{1}{2}{3}{4}{5}{6}",
             nonce,
-            args.address,
-            args.challenge_id,
-            args.difficulty, // This is the hex string, not the number of zero bits
-            args.no_pre_mine,
-            args.latest_submission,
-            args.no_pre_mine_hour
+            challenge.address,
+            challenge.challenge_id,
+            challenge.difficulty, // This is the hex string, not the number of zero bits
+            challenge.no_pre_mine,
+            challenge.latest_submission,
+            challenge.no_pre_mine_hour
         );
 
         let hash_result = hash(&preimage.as_bytes(), &rom, 8, 256);
 
         if hash_structure_good(&hash_result, difficulty_mask) {
-            println!("{:016x}", nonce);
-            break;
+            return Ok(nonce);
         }
 
         nonce += 1;
     }
 }
+
+fn serve() -> io::Result<()> {
+    let stdin = io::stdin();
+    let mut stdout = io::stdout().lock();
+
+    // The ROM only depends on no_pre_mine, which is shared by all challenges of a day,
+    // so keep the last one instead of rebuilding 1 GB for every challenge.
+    let mut cached_rom: Option<(String, Rom)> = None;
+
+    for line in stdin.lock().lines() {
+        let line = line?;
+        if line.trim().is_empty() {
+            continue;
+        }
+
+        let response = match serde_json::from_str::<Challenge>(&line) {
+            Ok(challenge) => {
+                let is_cached =
+                    matches!(&cached_rom, Some((key, _)) if *key == challenge.no_pre_mine);
+                if !is_cached {
+                    // Drop the old ROM before allocating the new one
+                    drop(cached_rom.take());
+                    cached_rom = Some((
+                        challenge.no_pre_mine.clone(),
+                        init_rom(&challenge.no_pre_mine),
+                    ));
+                }
+                let (_, rom) = cached_rom.as_ref().unwrap();
+
+                match solve(&challenge, rom) {
+                    Ok(nonce) => Response::Nonce(format!("{:016x}", nonce)),
+                    Err(e) => Response::Error(format!("invalid difficulty: {}", e)),
+                }
+            }
+            Err(e) => Response::Error(format!("invalid challenge: {}", e)),
+        };
+
+        writeln!(stdout, "{}", serde_json::to_string(&response)?)?;
+        stdout.flush()?;
+    }
+    Ok(())
+}
+
+fn main() {
+    let args = Args::parse();
+
+    if args.server {
+        serve().unwrap();
+        return;
+    }
+
+    // clap enforces these when not in server mode
+    let challenge = Challenge {
+        address: args.address.unwrap(),
+        challenge_id: args.challenge_id.unwrap(),
+        difficulty: args.difficulty.unwrap(),
+        no_pre_mine: args.no_pre_mine.unwrap(),
+        latest_submission: args.latest_submission.unwrap(),
+        no_pre_mine_hour: args.no_pre_mine_hour.unwrap(),
+    };
+
+    // Initialize AshMaize ROM
+    let rom = init_rom(&challenge.no_pre_mine);
+
+    let nonce = solve(&challenge, &rom).unwrap();
+    println!("{:016x}", nonce);
+}
@@ -1,6 +1,6 @@
 #[cfg(test)]
 mod tests {
-    use crate::{hash_structure_good, init_rom}; // Import hash_structure_good, init_rom and constants
+    use crate::{Challenge, Response, hash_structure_good, init_rom}; // Import hash_structure_good, init_rom and constants
     use ashmaize::hash;
 
     #[test]
@@ -42,4 +42,22 @@ mod tests {
             "Hash does not meet difficulty requirements"
         );
     }
+
+    #[test]
+    fn server_protocol_round_trip() {
+        // One request line as written by the Python orchestrator
+        let line = r#"{"address": "addr1", "challenge_id": "**D01C17", "difficulty": "00007FFF", "no_pre_mine": "e8a1", "latest_submission": "2025-10-31T15:59:59.000Z", "no_pre_mine_hour": "967125414"}"#;
+        let challenge: Challenge = serde_json::from_str(line).unwrap();
+        assert_eq!(challenge.address, "addr1");
+        assert_eq!(challenge.challenge_id, "**D01C17");
+        assert_eq!(challenge.latest_submission, "2025-10-31T15:59:59.000Z");
+
+        let nonce = Response::Nonce("001af01e65703909".to_string());
+        assert_eq!(
+            serde_json::to_string(&nonce).unwrap(),
+            r#"{"nonce":"001af01e65703909"}"#
+        );
+        let error = Response::Error("bad".to_string());
+        assert_eq!(serde_json::to_string(&error).unwrap(), r#"{"error":"bad"}"#);
+    }
 }